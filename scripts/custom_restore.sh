@@ -20,12 +20,8 @@ set -eu
 source "$(dirname "${BASH_SOURCE[0]}")/ui_lib.sh" || { echo "UI library not found or unreadable"; exit 1; }
 
 # Load credentials
-source .nutanix_creds || { echo "Credentials file not found or unreadable"; exit 1; }
-
-# Prerequisites
-command -v jq   >/dev/null || { echo "Please install jq (apt install jq)"; exit 1; }
-command -v curl >/dev/null || { echo "Please install curl (apt install curl)"; exit 1; }
-command -v sha1sum >/dev/null || { echo "Please install sha1sum"; exit 1; }
+load_credentials || exit 1
+check_prerequisites || exit 1
 
 # Configuration
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
@@ -40,12 +36,14 @@ declare -g -a SELECTED_SUBNET_UUIDS=()
 
 # Find available restore points
 find_restore_points() {
+    # Single find pass: locate the tasks CSV directly and emit its parent
+    # directory, instead of listing candidate dirs and stat()ing each one
     local restore_points=()
     while IFS= read -r -d '' dir; do
-        if [[ -f "$dir/vm_export_tasks.csv" ]]; then
-            restore_points+=("$dir")
-        fi
-    done < <(find "$SCRIPT_DIR/restore-points" -maxdepth 1 -type d -name "vm-export-*" -print0 2>/dev/null)
+        is_valid_restore_point_name "$(basename "$dir")" || continue
+        restore_points+=("$dir")
+    done < <(find "$SCRIPT_DIR/restore-points" -mindepth 2 -maxdepth 2 -type f \
+        -path "*/vm-export-*/vm_export_tasks.csv" -printf '%h\0' 2>/dev/null)
     
     if [[ ${#restore_points[@]} -eq 0 ]]; then
         echo "No restore points found. Please run vm_export_menu.sh first to create backups."
@@ -72,17 +70,14 @@ display_restore_points() {
     for i in "${!restore_points[@]}"; do
         local dir="${restore_points[i]}"
         local timestamp=$(basename "$dir" | sed 's/vm-export-//')
-        local vm_count=$(tail -n +2 "$dir/vm_export_tasks.csv" 2>/dev/null | wc -l)
+        local vm_count=$(wc -l < "$dir/vm_export_tasks.csv" 2>/dev/null || echo 0)
+        vm_count=$(( vm_count > 0 ? vm_count - 1 : 0 ))
         
-        # Calculate total size
+        # Calculate total size - find reports sizes from its own directory
+        # walk, so there is no extra stat process per OVA file
         local total_size=0
         if [[ -d "$dir" ]]; then
-            while IFS= read -r -d '' file; do
-                if [[ -f "$file" ]]; then
-                    local file_size=$(stat -c%s "$file" 2>/dev/null || echo "0")
-                    total_size=$((total_size + file_size))
-                fi
-            done < <(find "$dir" -name "*.ova" -print0 2>/dev/null)
+            total_size=$(find "$dir" -name "*.ova" -type f -printf '%s\n' 2>/dev/null | awk '{s+=$1} END {print s+0}')
         fi
         
         # Convert bytes to human readable format
@@ -346,33 +341,44 @@ display_vm_restore_points() {
 # Build resource maps for subnets and projects
 build_resource_maps() {
     echo "Loading available subnets and projects..."
-    
-    # Build subnets map using a safer parsing method
-    local subnets_json=$(curl -s -k -u "$USER:$PASS" \
+
+    # Fetch both lists in parallel background jobs - the calls are
+    # independent, so the network waits overlap
+    local fetch_dir
+    fetch_dir=$(mktemp -d)
+
+    curl_auth -s \
         -X POST "https://$PRISM:9440/api/nutanix/v3/subnets/list" \
         -H 'Content-Type: application/json' \
-        -d '{"kind":"subnet","length":1000,"offset":0}')
-    
+        -d '{"kind":"subnet","length":1000,"offset":0}' > "$fetch_dir/subnets.json" &
+
+    curl_auth -s \
+        -X POST "https://$PRISM:9440/api/nutanix/v3/projects/list" \
+        -H 'Content-Type: application/json' \
+        -d '{"kind":"project","length":100,"offset":0}' > "$fetch_dir/projects.json" &
+
+    wait
+
+    local subnets_json=$(cat "$fetch_dir/subnets.json" 2>/dev/null || true)
+    local projects_json=$(cat "$fetch_dir/projects.json" 2>/dev/null || true)
+    rm -rf "$fetch_dir"
+
+    # Build subnets map using a safer parsing method
     if [[ -n "$subnets_json" ]] && jq -e '.entities' <<< "$subnets_json" >/dev/null 2>&1; then
         # Use jq to safely parse and handle names with spaces
         local temp_file=$(mktemp)
         jq -r '.entities[]? | select(.status.name != null and .metadata.uuid != null) | "\(.status.name)|||\(.metadata.uuid)"' <<< "$subnets_json" > "$temp_file"
-        
+
         while IFS='|||' read -r name uuid; do
             # Clean any residual delimiters from UUID
             uuid=$(echo "$uuid" | sed 's/^|*//g')
             [[ -n "$name" && -n "$uuid" ]] && SUBNET_MAP["$name"]="$uuid"
         done < "$temp_file"
-        
+
         rm -f "$temp_file"
     fi
-    
+
     # Build projects map using the same safe parsing method
-    local projects_json=$(curl -s -k -u "$USER:$PASS" \
-        -X POST "https://$PRISM:9440/api/nutanix/v3/projects/list" \
-        -H 'Content-Type: application/json' \
-        -d '{"kind":"project","length":100,"offset":0}')
-    
     if [[ -n "$projects_json" ]] && jq -e '.entities' <<< "$projects_json" >/dev/null 2>&1; then
         # Use jq to safely parse and handle names with spaces
         local temp_file=$(mktemp)
@@ -750,7 +756,7 @@ upload_ova() {
     update_restore_status "$vm_name" "CREATING_ENTITY" 0
     
     # Create OVA entity
-    local create_resp=$(curl -s -k -u "$USER:$PASS" \
+    local create_resp=$(curl_auth -s \
         -X POST "https://$PRISM:9440/api/nutanix/v3/ovas" \
         -H 'Content-Type: application/json' \
         -d '{"name":"'"$ova_name"'","upload_length":'"$filesize"',"checksum":{"checksum_algorithm":"SHA_1","checksum_value":"'"$full_cs"'"}}')
@@ -761,15 +767,16 @@ upload_ova() {
         return 1
     fi
     
-    # Wait for OVA UUID
+    # Wait for OVA UUID - one jq pass pulls both fields from the response
     local ova_uuid=""
+    local task_status=""
     while [[ -z "$ova_uuid" ]]; do
-        local task_json=$(curl -s -k -u "$USER:$PASS" \
+        local task_json=$(curl_auth -s \
             -X GET "https://$PRISM:9440/api/nutanix/v3/tasks/$task_uuid" \
             -H 'Accept: application/json')
-        ova_uuid=$(jq -r '.entity_reference_list[0].uuid // empty' <<< "$task_json")
-        
-        if [[ "$(jq -r '.status' <<< "$task_json")" == "FAILED" ]]; then
+        IFS=$'\t' read -r ova_uuid task_status < <(jq -r '[(.entity_reference_list[0].uuid // ""), (.status // "UNKNOWN")] | @tsv' <<< "$task_json")
+
+        if [[ "$task_status" == "FAILED" ]]; then
             update_restore_status "$vm_name" "FAILED" 0
             return 1
         fi
@@ -787,7 +794,7 @@ upload_ova() {
         dd if="$ova_file" of="$tmpf" bs=$CHUNK_SIZE skip=$((off/CHUNK_SIZE)) count=1 status=none 2>/dev/null
         local cs=$(sha1sum "$tmpf" | cut -d' ' -f1)
         
-        curl -s -k -u "$USER:$PASS" \
+        curl_auth -s \
             -X PUT "https://$PRISM:9440/api/nutanix/v3/ovas/$ova_uuid/chunks" \
             -H 'Content-Type: application/octet-stream' \
             -H "X-Nutanix-Checksum-Type:SHA_1" \
@@ -806,7 +813,7 @@ upload_ova() {
     update_restore_status "$vm_name" "VALIDATING" 0
     
     # Concatenate chunks
-    local concat_resp=$(curl -s -k -u "$USER:$PASS" \
+    local concat_resp=$(curl_auth -s \
         -X POST "https://$PRISM:9440/api/nutanix/v3/ovas/$ova_uuid/chunks/concatenate" \
         -H 'Accept: application/json')
     
@@ -821,11 +828,11 @@ upload_ova() {
     local elapsed_time=0
     
     while :; do
-        local task_json=$(curl -s -k -u "$USER:$PASS" \
+        local task_json=$(curl_auth -s \
             -X GET "https://$PRISM:9440/api/nutanix/v3/tasks/$concat_task" \
             -H 'Accept: application/json')
-        local status_now=$(jq -r '.status' <<< "$task_json")
-        local pc=$(jq -r '.percentage_complete // 0' <<< "$task_json")
+        local status_now pc
+        IFS=$'\t' read -r status_now pc < <(jq -r '[(.status // "UNKNOWN"), ((.percentage_complete // 0) | tostring)] | @tsv' <<< "$task_json")
         
         update_restore_status "$vm_name" "VALIDATING" "$pc"
         
@@ -865,7 +872,7 @@ restore_vm() {
     update_restore_status "$vm_name" "RESTORING" 0
     
     # Fetch VM spec from OVA
-    local vm_spec_json=$(curl -s -k -u "$USER:$PASS" \
+    local vm_spec_json=$(curl_auth -s \
         -X GET "https://$PRISM:9440/api/nutanix/v3/ovas/$ova_uuid/vm_spec" \
         -H 'Content-Type: application/json')
     
@@ -939,7 +946,7 @@ restore_vm() {
         }')
     
     # Submit VM creation
-    local create_resp=$(curl -s -k -u "$USER:$PASS" \
+    local create_resp=$(curl_auth -s \
         -X POST "https://$PRISM:9440/api/nutanix/v3/vms" \
         -H 'Content-Type: application/json' \
         -d "$payload")
@@ -959,11 +966,11 @@ restore_vm() {
     
     # Monitor restoration progress
     while true; do
-        local task_json=$(curl -s -k -u "$USER:$PASS" \
+        local task_json=$(curl_auth -s \
             -X GET "https://$PRISM:9440/api/nutanix/v3/tasks/$task_id" \
             -H 'Accept: application/json')
-        local status_now=$(jq -r '.status' <<< "$task_json")
-        local pc=$(jq -r '.percentage_complete // 0' <<< "$task_json")
+        local status_now pc
+        IFS=$'\t' read -r status_now pc < <(jq -r '[(.status // "UNKNOWN"), ((.percentage_complete // 0) | tostring)] | @tsv' <<< "$task_json")
         
         update_restore_status "$vm_name" "RESTORING" "$pc"
         
@@ -1049,7 +1056,7 @@ perform_custom_restore() {
                 read -p "Delete uploaded OVA from Prism Central? (y/N): " delete_choice
                 if [[ "$delete_choice" =~ ^[Yy] ]]; then
                     echo "→ Deleting uploaded OVA..."
-                    curl -s -k -u "$USER:$PASS" \
+                    curl_auth -s \
                         -X DELETE "https://$PRISM:9440/api/nutanix/v3/ovas/$ova_uuid" \
                         -H 'Content-Type: application/json' >/dev/null
                     echo "✅ OVA deleted from Prism Central"
@@ -13,23 +13,18 @@ set -eu
 # Source the UI library
 source "$(dirname "${BASH_SOURCE[0]}")/ui_lib.sh" || { echo "UI library not found or unreadable"; exit 1; }
 
-# Load credentials
-source .nutanix_creds || { echo "Credentials file not found or unreadable"; exit 1; }
-
-# Prerequisites
-command -v jq   >/dev/null || { echo "Please install jq (apt install jq)"; exit 1; }
-command -v curl >/dev/null || { echo "Please install curl (apt install curl)"; exit 1; }
+# Load credentials and check prerequisites via the shared library
+load_credentials || exit 1
+check_prerequisites || exit 1
 
 # Configuration
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 POLL_INTERVAL=3
 
-# Fetch VMs from Prism Central
+# Fetch VMs from Prism Central (cached with a short TTL, stale fallback on
+# API failure - see ui_lib.sh)
 echo "Fetching VMs from $PRISM..."
-vms_json=$(curl -s -k -u "$USER:$PASS" \
-  -X POST "https://$PRISM:9440/api/nutanix/v3/vms/list" \
-  -H 'Content-Type: application/json' \
-  -d '{"length":1000}')
+vms_json=$(fetch_vms_cached) || { echo "Failed to fetch VMs from $PRISM"; exit 1; }
 
 # Parse and filter VMs using pipe delimiter
 declare -a vm_data=()
@@ -42,6 +37,21 @@ if [[ ${#vm_data[@]} -eq 0 ]]; then
   exit 0
 fi
 
+# Pre-compute the unique project list and per-project VM counts alongside
+# vm_data. The data is sorted by project, so adjacent duplicates collapse
+# in a single pass and the project menu never has to rescan every VM line.
+declare -a unique_projects=()
+declare -A project_vm_counts=()
+prev_project=""
+for vm in "${vm_data[@]}"; do
+  project="${vm%%|*}"
+  if [[ "$project" != "$prev_project" ]]; then
+    unique_projects+=("$project")
+    prev_project="$project"
+  fi
+  project_vm_counts["$project"]=$(( ${project_vm_counts["$project"]:-0} + 1 ))
+done
+
 # Display menu with pagination
 display_menu() {
   clear
@@ -196,18 +206,7 @@ select_project_vms() {
     return
   fi
   
-  # Get unique projects using pipe delimiter
-  declare -A seen_projects
-  local unique_projects=()
-  
-  for vm_line in "${vm_data[@]}"; do
-    IFS='|' read -r proj name uuid power_state <<< "$vm_line"
-    if [[ -n "$proj" && -z "${seen_projects[$proj]:-}" ]]; then
-      seen_projects["$proj"]=1
-      unique_projects+=("$proj")
-    fi
-  done
-  
+  # Unique projects were pre-computed when vm_data was parsed
   if [[ ${#unique_projects[@]} -eq 0 ]]; then
     echo "Error: No projects found in VM data."
     echo ""
@@ -220,14 +219,7 @@ select_project_vms() {
   
   for i in "${!unique_projects[@]}"; do
     local project="${unique_projects[i]}"
-    local vm_count=0
-    for vm_line in "${vm_data[@]}"; do
-      IFS='|' read -r vm_proj vm_name vm_uuid vm_power_state <<< "$vm_line"
-      if [[ "$vm_proj" == "$project" ]]; then
-        vm_count=$((vm_count + 1))
-      fi
-    done
-    printf "%2d) %-20s (%d VMs)\n" "$((i+1))" "$project" "$vm_count"
+    printf "%2d) %-20s (%d VMs)\n" "$((i+1))" "$project" "${project_vm_counts[$project]:-0}"
   done
   
   echo ""
@@ -277,14 +269,13 @@ delete_ovas_from_prism() {
     return
   fi
   
-  # Map OVA names to UUIDs
+  # Map OVA names to UUIDs with one streaming jq pass - the old per-index
+  # loop forked two jq processes per entity, each re-parsing the full payload
   declare -A ova_uuid_map
-  count=$(jq '.entities | length' <<< "$ovas_json")
-  for (( i=0; i<count; i++ )); do
-    name=$(jq -r ".entities[$i].info.name" <<< "$ovas_json")
-    uuid=$(jq -r ".entities[$i].metadata.uuid" <<< "$ovas_json")
+  while IFS=$'\t' read -r name uuid; do
+    [[ -n "$name" && -n "$uuid" ]] || continue
     ova_uuid_map["$name"]="$uuid"
-  done
+  done < <(jq -r '.entities[]? | [.info.name, .metadata.uuid] | @tsv' <<< "$ovas_json")
   
   # Calculate column widths for table display
   local max_name_width=7
@@ -316,7 +307,7 @@ delete_ovas_from_prism() {
       printf "%-${max_name_width}s %-${max_project_width}s %-10s " "$vm_name" "$vm_project" "${uuid:0:8}..."
       
       # Perform deletion
-      resp=$(curl -s -k -u "$USER:$PASS" \
+      resp=$(curl_auth -s \
         -X DELETE "https://$PRISM:9440/api/nutanix/v3/ovas/$uuid" \
         -H 'Content-Type: application/json')
       
@@ -475,29 +466,54 @@ echo ""
 
 declare -A status_map pct_map
 
+# Build the task URL list once; each poll fetches every task in a single
+# curl process, so the TLS connection to Prism Central is set up once per
+# poll and reused across tasks instead of once per task. Seed every task
+# as UNKNOWN so a failed poll can never read as completion - absence of a
+# status must not count as success.
+declare -a vm_uuid_order=() task_urls=()
+for vm_uuid in "${!task_map[@]}"; do
+  vm_uuid_order+=("$vm_uuid")
+  task_urls+=("https://$PRISM:9440/api/nutanix/v3/tasks/${task_map[$vm_uuid]}")
+  status_map[$vm_uuid]="UNKNOWN"
+  pct_map[$vm_uuid]=0
+done
+
 while true; do
   clear
   echo "Export Progress:"
   echo ""
   printf "%-30s %-15s %-10s %-10s\n" "VM_NAME" "PROJECT" "PROGRESS" "STATUS"
   echo "--------------------------------------------------------------------"
-  
-  for vm_uuid in "${!task_map[@]}"; do
-    task_json=$(curl -s -k -u "$USER:$PASS" \
-      -X GET "https://$PRISM:9440/api/nutanix/v3/tasks/${task_map[$vm_uuid]}" \
-      -H 'Accept: application/json')
-    
-    status=$(jq -r '.status' <<< "$task_json")
-    pct=$(jq -r '.percentage_complete // 0' <<< "$task_json")
-    
-    status_map[$vm_uuid]="$status"
-    pct_map[$vm_uuid]="$pct"
-    
+
+  # One curl for all tasks, one jq to parse the concatenated responses
+  tasks_json=$(curl_auth -s \
+    -H 'Accept: application/json' \
+    "${task_urls[@]}")
+
+  # Apply the batch only when every task produced a line: jq stops at the
+  # first unparseable response in the concatenated stream (e.g. a proxy
+  # error page), and a short batch would misattribute the remaining
+  # statuses to the wrong VMs. A rejected batch keeps the previous cycle's
+  # statuses and polls again.
+  mapfile -t poll_lines < <(jq -r '[(.status // "UNKNOWN"), ((.percentage_complete // 0) | tostring)] | @tsv' <<< "$tasks_json" 2>/dev/null)
+  if [[ ${#poll_lines[@]} -eq ${#vm_uuid_order[@]} ]]; then
+    task_idx=0
+    for poll_line in "${poll_lines[@]}"; do
+      IFS=$'\t' read -r status pct <<< "$poll_line"
+      vm_uuid="${vm_uuid_order[$task_idx]}"
+      status_map[$vm_uuid]="$status"
+      pct_map[$vm_uuid]="$pct"
+      task_idx=$((task_idx + 1))
+    done
+  fi
+
+  for vm_uuid in "${vm_uuid_order[@]}"; do
     printf "%-30s %-15s %3s%%       %s\n" \
       "${name_map[$vm_uuid]}" \
       "${project_map[$vm_uuid]}" \
-      "$pct" \
-      "$status"
+      "${pct_map[$vm_uuid]:-0}" \
+      "${status_map[$vm_uuid]:-UNKNOWN}"
   done
   
   # Check if all tasks succeeded
@@ -530,28 +546,36 @@ if [[ "$download_choice" =~ ^[Yy] ]]; then
   
   # Fetch OVA list
   echo "Fetching OVA list..."
-  ovas_json=$(curl -s -k -u "$USER:$PASS" \
+  ovas_json=$(curl_auth -s \
     -X POST "https://$PRISM:9440/api/nutanix/v3/ovas/list" \
     -H 'Content-Type: application/json' \
     -d '{"kind":"ova","length":1000,"offset":0,"sort_attribute":"name","sort_order":"ASCENDING"}')
-  
+
+  # Resolve every OVA name to its most recent UUID with one jq pass over
+  # the payload. Sorting by creation time ascending and letting later
+  # entries overwrite earlier ones leaves the newest UUID per name; the
+  # old code re-parsed the full payload twice per VM.
+  declare -A latest_ova_uuid=()
+  while IFS=$'\t' read -r name uuid; do
+    [[ -n "$name" && -n "$uuid" ]] || continue
+    latest_ova_uuid["$name"]="$uuid"
+  done < <(jq -r '.entities | sort_by(.metadata.creation_time) | .[] | [.info.name, .metadata.uuid] | @tsv' <<< "$ovas_json")
+
   # Download each OVA
   for vm_uuid in "${!task_map[@]}"; do
     vm_name="${name_map[$vm_uuid]}"
     ova_name="$vm_uuid"
-    
+
     echo -n "→ Downloading $vm_name... "
-    
-    # Find the most recent OVA with matching name (sort by creation time desc, take first)
-    ova_uuid=$(jq -r --arg tag "$ova_name" \
-      '.entities[] | select(.info.name==$tag) | {uuid: .metadata.uuid, created: .metadata.creation_time}' <<< "$ovas_json" | \
-      jq -r -s 'sort_by(.created) | reverse | .[0].uuid // empty')
-    
+
+    # Most recent OVA with matching name, from the pre-computed map
+    ova_uuid="${latest_ova_uuid[$ova_name]:-}"
+
     if [[ -n "$ova_uuid" && "$ova_uuid" != "null" && "$ova_uuid" != "empty" ]]; then
       outfile="$DOWNLOAD_DIR/${vm_uuid}.ova"
       
       # Use curl with better error handling
-      if curl -k -u "$USER:$PASS" -L \
+      if curl_auth -L \
         -H 'Accept: application/octet-stream' \
         "https://$PRISM:9440/api/nutanix/v3/ovas/$ova_uuid/file" \
         -o "$outfile" --fail --show-error; then
@@ -594,7 +618,7 @@ else
     # Fetch OVA list since we didn't do it for download
     echo ""
     echo "Fetching OVA list from Prism Central..."
-    ovas_json=$(curl -s -k -u "$USER:$PASS" \
+    ovas_json=$(curl_auth -s \
           -X POST "https://$PRISM:9440/api/nutanix/v3/ovas/list" \
           -H 'Content-Type: application/json' \
           -d '{"kind":"ova","length":1000,"offset":0,"sort_attribute":"name","sort_order":"ASCENDING"}')    
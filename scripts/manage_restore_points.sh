@@ -37,14 +37,20 @@ if [[ ! -d "$RESTORE_POINTS_DIR" ]]; then
     mkdir -p "$RESTORE_POINTS_DIR"
 fi
 
+# Restore point names: "vm-export-" plus timestamp-style characters only
+# (same pattern as ui_lib.sh; this script does not source the library)
+RESTORE_POINT_NAME_RE='^vm-export-[A-Za-z0-9._-]+$'
+
 # Find available restore points
 find_restore_points() {
+    # Single find pass: locate the tasks CSV directly and emit its parent
+    # directory, instead of listing candidate dirs and stat()ing each one
     local restore_points=()
     while IFS= read -r -d '' dir; do
-        if [[ -f "$dir/vm_export_tasks.csv" ]]; then
-            restore_points+=("$dir")
-        fi
-    done < <(find "$RESTORE_POINTS_DIR" -maxdepth 1 -type d -name "vm-export-*" -print0 2>/dev/null)
+        [[ "$(basename "$dir")" =~ $RESTORE_POINT_NAME_RE ]] || continue
+        restore_points+=("$dir")
+    done < <(find "$RESTORE_POINTS_DIR" -mindepth 2 -maxdepth 2 -type f \
+        -path "*/vm-export-*/vm_export_tasks.csv" -printf '%h\0' 2>/dev/null)
     
     printf '%s\n' "${restore_points[@]}" | sort -r  # Most recent first
 }
@@ -68,22 +74,36 @@ get_restore_point_details() {
     local restore_point="$1"
     local timestamp=$(basename "$restore_point" | sed 's/vm-export-//')
     local tasks_file="$restore_point/vm_export_tasks.csv"
+    local summary_file="$restore_point/.details_summary"
+
+    # Reuse the stored summary while nothing in the restore point has
+    # changed since it was written. -nt means strictly newer, and the
+    # rename that wrote the summary bumps the directory mtime in the same
+    # clock tick, so test "nothing is newer than the summary" rather than
+    # the summary being newer. OVAs are checked individually because one
+    # growing in place (a download still in flight) only touches its own
+    # mtime, not the directory's.
+    if [[ -s "$summary_file" ]] \
+        && ! [[ "$restore_point" -nt "$summary_file" ]] \
+        && ! [[ "$tasks_file" -nt "$summary_file" ]] \
+        && [[ -z "$(find "$restore_point" -name "*.ova" -type f -newer "$summary_file" -print -quit 2>/dev/null)" ]]; then
+        cat "$summary_file"
+        return 0
+    fi
     
-    # Count VMs
+    # Count VMs - one wc over the file, minus the header row, instead of
+    # a tail|wc pipeline
     local vm_count=0
     if [[ -f "$tasks_file" ]]; then
-        vm_count=$(tail -n +2 "$tasks_file" 2>/dev/null | wc -l)
+        vm_count=$(wc -l < "$tasks_file" 2>/dev/null || echo 0)
+        vm_count=$(( vm_count > 0 ? vm_count - 1 : 0 ))
     fi
     
-    # Calculate total size
+    # Calculate total size - find reports sizes from its own directory
+    # walk, so there is no extra stat process per OVA file
     local total_size=0
     if [[ -d "$restore_point" ]]; then
-        while IFS= read -r -d '' file; do
-            if [[ -f "$file" ]]; then
-                local file_size=$(stat -c%s "$file" 2>/dev/null || echo "0")
-                total_size=$((total_size + file_size))
-            fi
-        done < <(find "$restore_point" -name "*.ova" -print0 2>/dev/null)
+        total_size=$(find "$restore_point" -name "*.ova" -type f -printf '%s\n' 2>/dev/null | awk '{s+=$1} END {print s+0}')
     fi
     
     # Convert timestamp to readable format
@@ -115,8 +135,48 @@ get_restore_point_details() {
     else
         readable_timestamp="$timestamp"
     fi
-    
-    echo "$readable_timestamp|$vm_count|$total_size"
+
+    local details="$readable_timestamp|$vm_count|$total_size"
+
+    # Persist the summary atomically (tempfile + rename); read-only
+    # restore points simply skip the write
+    local tmp_file
+    if tmp_file=$(mktemp "$restore_point/.details_summary.XXXXXX" 2>/dev/null); then
+        echo "$details" > "$tmp_file"
+        mv -f "$tmp_file" "$summary_file"
+    fi
+
+    echo "$details"
+}
+
+# Get details for every restore point in one batch.
+# Emits one "readable_date|vm_count|size_bytes" line per argument, in input
+# order, so menus can compute all rows once and reuse them across redraws.
+# Each restore point is sized in a background job - the scans are pure I/O,
+# so on slow or network storage they overlap instead of running serially.
+get_all_restore_point_details() {
+    local tmp_dir
+    tmp_dir=$(mktemp -d)
+    local max_jobs=8
+    local launched=0
+    local restore_point
+
+    for restore_point in "$@"; do
+        get_restore_point_details "$restore_point" > "$tmp_dir/$launched" &
+        launched=$((launched + 1))
+        # Bound concurrency batch-wise so many restore points don't fork
+        # an unbounded number of scans at once
+        if (( launched % max_jobs == 0 )); then
+            wait
+        fi
+    done
+    wait
+
+    local i
+    for (( i=0; i<launched; i++ )); do
+        cat "$tmp_dir/$i"
+    done
+    rm -rf "$tmp_dir"
 }
 
 # Display main menu
@@ -150,13 +210,13 @@ display_main_menu() {
     
     printf "%-3s %-35s %-5s %-10s\n" "ID" "BACKUP_DATE" "VMs" "SIZE"
     echo "------------------------------------------------------------"
-    
+
+    local rp_details
+    mapfile -t rp_details < <(get_all_restore_point_details "${restore_points[@]}")
+
     for i in "${!restore_points[@]}"; do
-        local restore_point="${restore_points[i]}"
-        local details
-        details=$(get_restore_point_details "$restore_point")
-        IFS='|' read -r readable_date vm_count size_bytes <<< "$details"
-        
+        IFS='|' read -r readable_date vm_count size_bytes <<< "${rp_details[i]}"
+
         local size_display=$(human_readable_size "$size_bytes")
         
         printf "%-3d %-35s %-5d %-10s\n" "$((i+1))" "$readable_date" "$vm_count" "$size_display"
@@ -179,18 +239,22 @@ display_main_menu() {
 }
 
 # Display restore point details
+# Accepts pre-computed details as an optional third argument so callers
+# that already sized the restore point don't trigger another walk.
 display_restore_point_details() {
     local restore_point="$1"
     local index="$2"
-    
+    local details="${3:-}"
+
     clear
     echo -e "${BOLD}${MAGENTA}═══════════════════════════════════════════${NC}"
     echo -e "        Restore Point Details"
     echo -e "${BOLD}${MAGENTA}═══════════════════════════════════════════${NC}"
     echo ""
-    
-    local details
-    details=$(get_restore_point_details "$restore_point")
+
+    if [[ -z "$details" ]]; then
+        details=$(get_restore_point_details "$restore_point")
+    fi
     IFS='|' read -r readable_date vm_count size_bytes <<< "$details"
     
     local size_display=$(human_readable_size "$size_bytes")
@@ -209,15 +273,23 @@ display_restore_point_details() {
         printf "%-25s %-20s %-10s\n" "VM_NAME" "PROJECT" "STATUS"
         echo "----------------------------------------"
         
+        # Build the set of OVA files present once, instead of testing the
+        # filesystem again for every CSV row
+        declare -A ova_present=()
+        local f
+        for f in "$restore_point"/*.ova; do
+            [[ -e "$f" ]] || continue
+            ova_present["$(basename "$f")"]=1
+        done
+
         while IFS=',' read -r vm_name vm_uuid project_name task_uuid ova_name; do
             [[ "$vm_name" == "VM_NAME" ]] && continue
-            
-            local ova_file="$restore_point/${ova_name}.ova"
+
             local status="Missing"
-            if [[ -f "$ova_file" ]]; then
+            if [[ -n "${ova_present[${ova_name}.ova]:-}" ]]; then
                 status="Available"
             fi
-            
+
             printf "%-25s %-20s %-10s\n" "$vm_name" "$project_name" "$status"
         done < "$tasks_file"
         
@@ -232,12 +304,16 @@ display_restore_point_details() {
 }
 
 # Delete restore point with confirmation
+# Accepts pre-computed details as an optional third argument; otherwise a
+# deletion would walk the whole tree once to size it and again to remove it.
 delete_restore_point() {
     local restore_point="$1"
     local index="$2"
-    
-    local details
-    details=$(get_restore_point_details "$restore_point")
+    local details="${3:-}"
+
+    if [[ -z "$details" ]]; then
+        details=$(get_restore_point_details "$restore_point")
+    fi
     IFS='|' read -r readable_date vm_count size_bytes <<< "$details"
     
     local size_display=$(human_readable_size "$size_bytes")
@@ -287,26 +363,29 @@ delete_multiple_restore_points() {
     echo ""
     
     declare -A selected=()
-    
+
+    # Compute all details once; redraws, the confirmation list and the
+    # deletion loop all reuse these rows instead of re-walking every
+    # restore point per iteration.
+    local rp_details
+    mapfile -t rp_details < <(get_all_restore_point_details "${restore_points[@]}")
+
     while true; do
         clear
         echo -e "${BOLD}${MAGENTA}═══════════════════════════════════════════${NC}"
         echo -e "        Delete Multiple Restore Points"
         echo -e "${BOLD}${MAGENTA}═══════════════════════════════════════════${NC}"
         echo ""
-        
+
         echo "Select restore points to delete:"
         echo ""
-        
+
         printf "%-3s %-35s %-5s %-10s %-10s\n" "ID" "BACKUP_DATE" "VMs" "SIZE" "SELECTED"
         echo "--------------------------------------------------------------------"
-        
+
         for i in "${!restore_points[@]}"; do
-            local restore_point="${restore_points[i]}"
-            local details
-            details=$(get_restore_point_details "$restore_point")
-            IFS='|' read -r readable_date vm_count size_bytes <<< "$details"
-            
+            IFS='|' read -r readable_date vm_count size_bytes <<< "${rp_details[i]}"
+
             local size_display=$(human_readable_size "$size_bytes")
             local status=""
             if [[ -n "${selected[$((i+1))]:-}" ]]; then
@@ -363,10 +442,7 @@ delete_multiple_restore_points() {
                 echo ""
                 echo "Selected restore points:"
                 for idx in "${!selected[@]}"; do
-                    local restore_point="${restore_points[$((idx-1))]}"
-                    local details
-                    details=$(get_restore_point_details "$restore_point")
-                    IFS='|' read -r readable_date vm_count size_bytes <<< "$details"
+                    IFS='|' read -r readable_date vm_count size_bytes <<< "${rp_details[$((idx-1))]}"
                     echo "  $idx) $readable_date ($vm_count VMs)"
                 done
                 echo ""
@@ -378,19 +454,38 @@ delete_multiple_restore_points() {
                 if [[ "$confirm" == "DELETE" ]]; then
                     echo ""
                     echo "Deleting selected restore points..."
-                    
-                    local success_count=0
-                    local fail_count=0
-                    
+
+                    # Each restore point is independent filesystem I/O, so
+                    # remove them in parallel background jobs (bounded at 8)
+                    # instead of serially, then report results in order
+                    local job_dir
+                    job_dir=$(mktemp -d)
+                    local max_jobs=8
+                    local launched=0
+
                     for idx in "${!selected[@]}"; do
                         local restore_point="${restore_points[$((idx-1))]}"
-                        local details
-                        details=$(get_restore_point_details "$restore_point")
-                        IFS='|' read -r readable_date vm_count size_bytes <<< "$details"
-                        
+                        (
+                            if rm -rf "$restore_point" 2>/dev/null; then
+                                touch "$job_dir/$idx.ok"
+                            fi
+                        ) &
+                        launched=$((launched + 1))
+                        if (( launched % max_jobs == 0 )); then
+                            wait
+                        fi
+                    done
+                    wait
+
+                    local success_count=0
+                    local fail_count=0
+
+                    for idx in $(printf '%s\n' "${!selected[@]}" | sort -n); do
+                        IFS='|' read -r readable_date vm_count size_bytes <<< "${rp_details[$((idx-1))]}"
+
                         echo -n "→ Deleting $readable_date... "
-                        
-                        if rm -rf "$restore_point"; then
+
+                        if [[ -e "$job_dir/$idx.ok" ]]; then
                             echo -e "${GREEN}✅ Success${NC}"
                             success_count=$((success_count + 1))
                         else
@@ -398,6 +493,8 @@ delete_multiple_restore_points() {
                             fail_count=$((fail_count + 1))
                         fi
                     done
+
+                    rm -rf "$job_dir"
                     
                     echo ""
                     echo "Deletion Summary:"
@@ -547,14 +644,19 @@ main() {
             [0-9]*)
                 if [[ "$choice" -ge 1 && "$choice" -le ${#restore_points[@]} ]]; then
                     local selected_restore_point="${restore_points[$((choice-1))]}"
-                    
+
+                    # Size the restore point once; the detail view and a
+                    # subsequent delete reuse the same result
+                    local selected_details
+                    selected_details=$(get_restore_point_details "$selected_restore_point")
+
                     while true; do
-                        display_restore_point_details "$selected_restore_point" "$choice"
+                        display_restore_point_details "$selected_restore_point" "$choice" "$selected_details"
                         read -p "Enter choice: " detail_choice
-                        
+
                         case "$detail_choice" in
                             d|D)
-                                delete_restore_point "$selected_restore_point" "$choice"
+                                delete_restore_point "$selected_restore_point" "$choice" "$selected_details"
                                 break
                                 ;;
                             b|B)
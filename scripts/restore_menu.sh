@@ -19,13 +19,9 @@ set -eu
 # Source the UI library
 source "$(dirname "${BASH_SOURCE[0]}")/ui_lib.sh" || { echo "UI library not found or unreadable"; exit 1; }
 
-# Load credentials
-source .nutanix_creds || { echo "Credentials file not found or unreadable"; exit 1; }
-
-# Prerequisites
-command -v jq   >/dev/null || { echo "Please install jq (apt install jq)"; exit 1; }
-command -v curl >/dev/null || { echo "Please install curl (apt install curl)"; exit 1; }
-command -v sha1sum >/dev/null || { echo "Please install sha1sum"; exit 1; }
+# Load credentials and check prerequisites via the shared library
+load_credentials || exit 1
+check_prerequisites || exit 1
 
 # Configuration
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
@@ -35,13 +31,15 @@ MAX_UPLOAD_JOBS=4
 
 # Find available restore points
 find_restore_points() {
+    # Single find pass: locate the tasks CSV directly and emit its parent
+    # directory, instead of listing candidate dirs and stat()ing each one
     local restore_points=()
     while IFS= read -r -d '' dir; do
-        if [[ -f "$dir/vm_export_tasks.csv" ]]; then
-            restore_points+=("$dir")
-        fi
-    done < <(find "$SCRIPT_DIR/restore-points" -maxdepth 1 -type d -name "vm-export-*" -print0 2>/dev/null)
-    
+        is_valid_restore_point_name "$(basename "$dir")" || continue
+        restore_points+=("$dir")
+    done < <(find "$SCRIPT_DIR/restore-points" -mindepth 2 -maxdepth 2 -type f \
+        -path "*/vm-export-*/vm_export_tasks.csv" -printf '%h\0' 2>/dev/null)
+
     if [[ ${#restore_points[@]} -eq 0 ]]; then
         echo "No restore points found. Please run vm_export_menu.sh first to create backups."
         exit 1
@@ -67,17 +65,15 @@ display_restore_points() {
     for i in "${!restore_points[@]}"; do
         local dir="${restore_points[i]}"
         local timestamp=$(basename "$dir" | sed 's/vm-export-//')
-        local vm_count=$(tail -n +2 "$dir/vm_export_tasks.csv" 2>/dev/null | wc -l)
+        local vm_count=$(wc -l < "$dir/vm_export_tasks.csv" 2>/dev/null || echo 0)
+        vm_count=$(( vm_count > 0 ? vm_count - 1 : 0 ))
         
-        # Calculate total size of all OVA files in this restore point
+        # Calculate total size of all OVA files in this restore point -
+        # find reports sizes from its own directory walk, so there is no
+        # extra stat process per file
         local total_size=0
         if [[ -d "$dir" ]]; then
-            while IFS= read -r -d '' file; do
-                if [[ -f "$file" ]]; then
-                    local file_size=$(stat -c%s "$file" 2>/dev/null || echo "0")
-                    total_size=$((total_size + file_size))
-                fi
-            done < <(find "$dir" -name "*.ova" -print0 2>/dev/null)
+            total_size=$(find "$dir" -name "*.ova" -type f -printf '%s\n' 2>/dev/null | awk '{s+=$1} END {print s+0}')
         fi
         
         # Convert bytes to human readable format
@@ -152,14 +148,22 @@ load_vm_data() {
         return 1
     fi
     
+    # Build the set of OVA files present once, instead of testing the
+    # filesystem again for every CSV row
+    declare -A ova_present=()
+    local f
+    for f in "$restore_point"/*.ova; do
+        [[ -e "$f" ]] || continue
+        ova_present["$(basename "$f")"]=1
+    done
+
     local temp_file=$(mktemp)
     while IFS=',' read -r vm_name vm_uuid project_name task_uuid ova_name; do
         [[ "$vm_name" == "VM_NAME" ]] && continue
-        
+
         # Check if OVA file exists
-        local ova_file="$restore_point/${ova_name}.ova"
-        if [[ -f "$ova_file" ]]; then
-            echo "$project_name|$vm_name|$vm_uuid|$ova_name|$ova_file" >> "$temp_file"
+        if [[ -n "${ova_present[${ova_name}.ova]:-}" ]]; then
+            echo "$project_name|$vm_name|$vm_uuid|$ova_name|$restore_point/${ova_name}.ova" >> "$temp_file"
         fi
     done < "$tasks_file"
     
@@ -304,16 +308,19 @@ select_project_vms() {
     echo "==========================================="
     echo ""
     
-    # Get unique projects
+    # Get unique projects and per-project VM counts in one pass
     declare -A seen_projects
+    declare -A project_vm_counts=()
     local unique_projects=()
-    
+
     for vm_line in "${vm_data[@]}"; do
         IFS='|' read -r proj name uuid ova_name ova_file <<< "$vm_line"
-        if [[ -n "$proj" && -z "${seen_projects[$proj]:-}" ]]; then
+        [[ -n "$proj" ]] || continue
+        if [[ -z "${seen_projects[$proj]:-}" ]]; then
             seen_projects["$proj"]=1
             unique_projects+=("$proj")
         fi
+        project_vm_counts["$proj"]=$(( ${project_vm_counts["$proj"]:-0} + 1 ))
     done
     
     if [[ ${#unique_projects[@]} -eq 0 ]]; then
@@ -328,14 +335,7 @@ select_project_vms() {
     
     for i in "${!unique_projects[@]}"; do
         local project="${unique_projects[i]}"
-        local vm_count=0
-        for vm_line in "${vm_data[@]}"; do
-            IFS='|' read -r vm_proj vm_name vm_uuid vm_ova vm_file <<< "$vm_line"
-            if [[ "$vm_proj" == "$project" ]]; then
-                vm_count=$((vm_count + 1))
-            fi
-        done
-        printf "%2d) %-20s (%d VMs)\n" "$((i+1))" "$project" "$vm_count"
+        printf "%2d) %-20s (%d VMs)\n" "$((i+1))" "$project" "${project_vm_counts[$project]:-0}"
     done
     
     echo ""
@@ -382,7 +382,7 @@ upload_ova() {
     update_restore_status "$vm_name" "CREATING_ENTITY" 0
     
     # Create OVA entity
-    local create_resp=$(curl -s -k -u "$USER:$PASS" \
+    local create_resp=$(curl_auth -s \
         -X POST "https://$PRISM:9440/api/nutanix/v3/ovas" \
         -H 'Content-Type: application/json' \
         -d '{"name":"'"$ova_name"'","upload_length":'"$filesize"',"checksum":{"checksum_algorithm":"SHA_1","checksum_value":"'"$full_cs"'"}}')
@@ -395,15 +395,16 @@ upload_ova() {
         return 1
     fi
     
-    # Wait for OVA UUID
+    # Wait for OVA UUID - one jq pass pulls both fields from the response
     local ova_uuid=""
+    local task_status=""
     while [[ -z "$ova_uuid" ]]; do
-        local task_json=$(curl -s -k -u "$USER:$PASS" \
+        local task_json=$(curl_auth -s \
             -X GET "https://$PRISM:9440/api/nutanix/v3/tasks/$task_uuid" \
             -H 'Accept: application/json')
-        ova_uuid=$(jq -r '.entity_reference_list[0].uuid // empty' <<< "$task_json")
-        
-        if [[ "$(jq -r '.status' <<< "$task_json")" == "FAILED" ]]; then
+        IFS=$'\t' read -r ova_uuid task_status < <(jq -r '[(.entity_reference_list[0].uuid // ""), (.status // "UNKNOWN")] | @tsv' <<< "$task_json")
+
+        if [[ "$task_status" == "FAILED" ]]; then
             update_restore_status "$vm_name" "FAILED" 0
             return 1
         fi
@@ -429,7 +430,7 @@ upload_ova() {
         
         cs=$(sha1sum "$tmpf" | cut -d' ' -f1)
         
-        curl -s -k -u "$USER:$PASS" \
+        curl_auth -s \
             -X PUT "https://$PRISM:9440/api/nutanix/v3/ovas/$ova_uuid/chunks" \
             -H 'Content-Type: application/octet-stream' \
             -H "X-Nutanix-Checksum-Type:SHA_1" \
@@ -448,7 +449,7 @@ upload_ova() {
     update_restore_status "$vm_name" "VALIDATING" 0
     
     # Concatenate chunks
-    local concat_resp=$(curl -s -k -u "$USER:$PASS" \
+    local concat_resp=$(curl_auth -s \
         -X POST "https://$PRISM:9440/api/nutanix/v3/ovas/$ova_uuid/chunks/concatenate" \
         -H 'Accept: application/json')
     
@@ -466,11 +467,11 @@ upload_ova() {
     local elapsed_time=0
     
     while :; do
-        local task_json=$(curl -s -k -u "$USER:$PASS" \
+        local task_json=$(curl_auth -s \
             -X GET "https://$PRISM:9440/api/nutanix/v3/tasks/$concat_task" \
             -H 'Accept: application/json')
-        local status_now=$(jq -r '.status' <<< "$task_json")
-        local pc=$(jq -r '.percentage_complete // 0' <<< "$task_json")
+        local status_now pc
+        IFS=$'\t' read -r status_now pc < <(jq -r '[(.status // "UNKNOWN"), ((.percentage_complete // 0) | tostring)] | @tsv' <<< "$task_json")
         
         update_restore_status "$vm_name" "VALIDATING" "$pc"
         
@@ -508,13 +509,13 @@ build_resource_maps() {
     declare -gA CLUSTER_MAP=()
     declare -gA PROJECT_MAP=()
     declare -gA OVA_MAP=()
-    
-    # Build associative map for API resources
-    build_map() {
-        local endpoint="$1" kind="$2" name_key="$3" uuid_key="$4" map_name="$5" search_range="$6"
-        local json
-        
-        json=$(curl -s -k -u "$USER:$PASS" \
+
+    # Fetch one list endpoint into a file; run as a background job so the
+    # independent list calls overlap instead of waiting on each other
+    fetch_list() {
+        local endpoint="$1" kind="$2" search_range="$3" out_file="$4"
+
+        curl_auth -s \
             -X POST "https://$PRISM:9440/api/nutanix/v3/$endpoint/list" \
             -H 'Content-Type: application/json' \
             -d '{
@@ -523,18 +524,23 @@ build_resource_maps() {
                 "offset": 0,
                 "sort_attribute": "name",
                 "sort_order": "ASCENDING"
-            }')
-        
+            }' > "$out_file"
+    }
+
+    # Build associative map for API resources from a fetched response file
+    build_map() {
+        local json_file="$1" endpoint="$2" name_key="$3" uuid_key="$4" map_name="$5"
+
         # Check if API call was successful
-        if [[ -z "$json" ]] || ! jq -e '.entities' <<< "$json" >/dev/null 2>&1; then
+        if [[ ! -s "$json_file" ]] || ! jq -e '.entities' "$json_file" >/dev/null 2>&1; then
             echo "Warning: Failed to fetch $endpoint or empty response"
             return 1
         fi
-        
+
         # Parse and populate map without eval
         local temp_file=$(mktemp)
-        jq -r ".entities[]? | select(.$name_key != null and .$uuid_key != null) | .$name_key + \"=\" + .$uuid_key" <<< "$json" > "$temp_file"
-        
+        jq -r ".entities[]? | select(.$name_key != null and .$uuid_key != null) | .$name_key + \"=\" + .$uuid_key" "$json_file" > "$temp_file"
+
         while IFS='=' read -r name uuid; do
             [[ -n "$name" && -n "$uuid" ]] || continue
             case "$map_name" in
@@ -544,14 +550,25 @@ build_resource_maps() {
                 OVA_MAP)     OVA_MAP["$name"]="$uuid" ;;
             esac
         done < "$temp_file"
-        
+
         rm -f "$temp_file"
     }
-    
-    build_map "subnets"  "subnet"  "status.name"      "metadata.uuid" SUBNET_MAP 1000
-    build_map "clusters" "cluster" "spec.name"        "metadata.uuid" CLUSTER_MAP 1000
-    build_map "projects" "project" "status.name"      "metadata.uuid" PROJECT_MAP 100
+
+    # Overlap the three network fetches, then parse locally
+    local tmp_dir
+    tmp_dir=$(mktemp -d)
+
+    fetch_list "subnets"  "subnet"  1000 "$tmp_dir/subnets.json" &
+    fetch_list "clusters" "cluster" 1000 "$tmp_dir/clusters.json" &
+    fetch_list "projects" "project" 100  "$tmp_dir/projects.json" &
+    wait
+
+    build_map "$tmp_dir/subnets.json"  "subnets"  "status.name" "metadata.uuid" SUBNET_MAP
+    build_map "$tmp_dir/clusters.json" "clusters" "spec.name"   "metadata.uuid" CLUSTER_MAP
+    build_map "$tmp_dir/projects.json" "projects" "status.name" "metadata.uuid" PROJECT_MAP
     # Skip OVA fetching since we're uploading new ones
+
+    rm -rf "$tmp_dir"
 }
 
 # Restore VM from uploaded OVA
@@ -566,7 +583,7 @@ restore_vm() {
     update_restore_status "$vm_name" "RESTORING" 0
     
     # Fetch VM spec from OVA
-    local vm_spec_json=$(curl -s -k -u "$USER:$PASS" \
+    local vm_spec_json=$(curl_auth -s \
         -X GET "https://$PRISM:9440/api/nutanix/v3/ovas/$ova_uuid/vm_spec" \
         -H 'Content-Type: application/json')
     
@@ -620,7 +637,7 @@ restore_vm() {
         }')
     
     # Submit VM creation
-    local create_resp=$(curl -s -k -u "$USER:$PASS" \
+    local create_resp=$(curl_auth -s \
         -X POST "https://$PRISM:9440/api/nutanix/v3/vms" \
         -H 'Content-Type: application/json' \
         -d "$payload")
@@ -641,11 +658,11 @@ restore_vm() {
     
     # Monitor restore progress
     while :; do
-        local task_json=$(curl -s -k -u "$USER:$PASS" \
+        local task_json=$(curl_auth -s \
             -X GET "https://$PRISM:9440/api/nutanix/v3/tasks/$task_id" \
             -H 'Accept: application/json')
-        local status_now=$(jq -r '.status' <<< "$task_json")
-        local pc=$(jq -r '.percentage_complete // 0' <<< "$task_json")
+        local status_now pc
+        IFS=$'\t' read -r status_now pc < <(jq -r '[(.status // "UNKNOWN"), ((.percentage_complete // 0) | tostring)] | @tsv' <<< "$task_json")
         
         update_restore_status "$vm_name" "RESTORING" "$pc"
         
@@ -800,7 +817,7 @@ delete_uploaded_ovas() {
         printf "%-${max_name_width}s %-${max_project_width}s %-10s " "$vm_name" "$vm_project" "${ova_uuid:0:8}..."
         
         # Perform deletion
-        resp=$(curl -s -k -u "$USER:$PASS" \
+        resp=$(curl_auth -s \
             -X DELETE "https://$PRISM:9440/api/nutanix/v3/ovas/$ova_uuid" \
             -H 'Content-Type: application/json')
         
@@ -58,6 +58,16 @@ readonly DEFAULT_TIMEOUT=120000  # 2 minutes in milliseconds
 readonly CREDS_FILE=".nutanix_creds"
 readonly RESTORE_POINTS_DIR="restore-points"
 
+# API response cache (per-user, short TTL so repeat menu refreshes reuse
+# the same payload instead of hitting Prism Central again)
+readonly API_CACHE_DIR="${TMPDIR:-/tmp}/nutanix-ova-tool-cache-$(id -u)"
+readonly VM_LIST_CACHE_TTL=15          # seconds - VM inventory changes slowly
+
+# Server-side VM list filter: exclude Prism Central's internal project so
+# those VMs never cross the wire. Callers keep their client-side jq filter
+# as a safety net in case a given Prism version ignores the expression.
+readonly VM_LIST_FILTER="project_name!=_internal"
+
 # ============================================================================
 # GLOBAL VARIABLES
 # ============================================================================
@@ -236,21 +246,36 @@ timestamp_to_readable() {
 # PREREQUISITE CHECKING
 # ============================================================================
 
+# Memoized prerequisite state - tool availability doesn't change while
+# the process runs, so the PATH lookups happen at most once
+_PREREQ_STATE=""
+_PREREQ_MISSING=""
+
 # Check all prerequisites
 check_prerequisites() {
     local silent=${1:-false}
-    local required_commands=("jq" "curl" "sha1sum")
-    local missing_commands=()
-    
-    for cmd in "${required_commands[@]}"; do
-        if ! command_exists "$cmd"; then
-            missing_commands+=("$cmd")
+
+    if [[ -z "$_PREREQ_STATE" ]]; then
+        local required_commands=("jq" "curl" "sha1sum")
+        local missing_commands=()
+
+        for cmd in "${required_commands[@]}"; do
+            if ! command_exists "$cmd"; then
+                missing_commands+=("$cmd")
+            fi
+        done
+
+        if [[ ${#missing_commands[@]} -gt 0 ]]; then
+            _PREREQ_STATE="fail"
+            _PREREQ_MISSING="${missing_commands[*]}"
+        else
+            _PREREQ_STATE="ok"
         fi
-    done
-    
-    if [[ ${#missing_commands[@]} -gt 0 ]]; then
+    fi
+
+    if [[ "$_PREREQ_STATE" == "fail" ]]; then
         if [[ "$silent" != "true" ]]; then
-            print_error "Missing required commands: ${missing_commands[*]}"
+            print_error "Missing required commands: $_PREREQ_MISSING"
             echo ""
             echo "Installation instructions:"
             echo "  • Ubuntu/Debian: sudo apt-get install jq curl coreutils"
@@ -259,7 +284,7 @@ check_prerequisites() {
         fi
         return 1
     fi
-    
+
     return 0
 }
 
@@ -311,10 +336,10 @@ test_api_connection() {
         return 1
     fi
     
-    # Test API authentication
+    # Test API authentication (temporary USER/PASS scope so curl_auth
+    # tests the supplied credentials, not whatever is already loaded)
     local response
-    response=$(curl -s --connect-timeout 10 --max-time 30 -k \
-        -u "$user:$pass" \
+    response=$(USER="$user" PASS="$pass" curl_auth -s --connect-timeout 10 --max-time 30 \
         -X POST \
         "https://$prism:9440/api/nutanix/v3/vms/list" \
         -H 'Content-Type: application/json' \
@@ -333,42 +358,234 @@ test_api_connection() {
     fi
 }
 
+# ============================================================================
+# RESPONSE CACHING
+# ============================================================================
+
+# Path of the cache file for a given cache key
+cache_file_for() {
+    echo "$API_CACHE_DIR/$1"
+}
+
+# Short digest scoping cache artifacts to the current Prism Central and
+# user, so switching .nutanix_creds to another cluster can never serve
+# (or stale-fall-back to) the previous cluster's payload
+cache_target_key() {
+    printf '%s' "$PRISM-$USER" | sha1sum | cut -c1-12
+}
+
+# Check whether a cache file exists and is younger than the given TTL
+cache_is_fresh() {
+    local cache_file="$1"
+    local ttl="$2"
+
+    [[ -s "$cache_file" ]] || return 1
+
+    local mtime
+    mtime=$(stat -c%Y "$cache_file" 2>/dev/null || echo 0)
+    local age=$(( $(date +%s) - mtime ))
+
+    [[ $age -lt $ttl ]]
+}
+
+# Create the cache directory and verify it is ours before using it; a
+# pre-existing directory under the predictable /tmp path owned by another
+# user must not be read from or written through
+cache_dir_ready() {
+    mkdir -p "$API_CACHE_DIR" 2>/dev/null
+    [[ -d "$API_CACHE_DIR" && -O "$API_CACHE_DIR" ]] || return 1
+    chmod 700 "$API_CACHE_DIR"
+}
+
+# Store stdin into the cache atomically (tempfile + rename)
+cache_store() {
+    local cache_file="$1"
+    local tmp_file
+
+    cache_dir_ready || return 1
+    tmp_file=$(mktemp "$API_CACHE_DIR/.tmp.XXXXXX")
+    cat > "$tmp_file"
+    mv -f "$tmp_file" "$cache_file"
+}
+
 # ============================================================================
 # NUTANIX API FUNCTIONS
 # ============================================================================
 
+# Run curl against Prism Central with credentials supplied via --config
+# through process substitution rather than argv, so the password never
+# appears in process listings (ps, /proc/*/cmdline). Backslashes and
+# double quotes are metacharacters inside curl's quoted config strings,
+# so escape them or such passwords would be silently mangled.
+curl_auth() {
+    local u=${USER//\\/\\\\} p=${PASS//\\/\\\\}
+    u=${u//\"/\\\"}
+    p=${p//\"/\\\"}
+    curl -k --config <(printf 'user = "%s:%s"\n' "$u" "$p") "$@"
+}
+
 # Make API call with standard error handling
 api_call() {
     local method="$1"
     local endpoint="$2"
     local data="${3:-}"
     local headers="${4:-}"
-    
-    local curl_cmd=()
-    curl_cmd+=("curl" "-s" "-k" "-u" "$USER:$PASS")
-    curl_cmd+=("-X" "$method")
-    curl_cmd+=("https://$PRISM:9440/api/nutanix/v3/$endpoint")
-    
+
+    local curl_args=()
+    curl_args+=("-s" "-X" "$method")
+    curl_args+=("https://$PRISM:9440/api/nutanix/v3/$endpoint")
+
     if [[ -n "$headers" ]]; then
-        curl_cmd+=("-H" "$headers")
+        curl_args+=("-H" "$headers")
     else
-        curl_cmd+=("-H" "Content-Type: application/json")
+        curl_args+=("-H" "Content-Type: application/json")
     fi
-    
+
     if [[ -n "$data" ]]; then
-        curl_cmd+=("-d" "$data")
+        curl_args+=("-d" "$data")
     fi
-    
-    "${curl_cmd[@]}"
+
+    curl_auth "${curl_args[@]}"
 }
 
 # Fetch VMs from Prism Central
 fetch_vms() {
     local length="${1:-1000}"
     local offset="${2:-0}"
-    
-    api_call "POST" "vms/list" \
-        '{"length":'"$length"',"offset":'"$offset"'}'
+
+    local response
+    response=$(api_call "POST" "vms/list" \
+        '{"length":'"$length"',"offset":'"$offset"',"filter":"'"$VM_LIST_FILTER"'"}')
+
+    # Some Prism versions reject the filter expression; retry unfiltered
+    # and let the caller's client-side filter handle it (empty responses
+    # checked explicitly: jq 1.6's -e exits 0 when given no input)
+    if [[ -z "$response" ]] || ! jq -e '.entities' <<< "$response" >/dev/null 2>&1; then
+        response=$(api_call "POST" "vms/list" \
+            '{"length":'"$length"',"offset":'"$offset"'}')
+    fi
+
+    printf '%s\n' "$response"
+}
+
+# Memoized curl ETag option support (needs curl 7.68+)
+_CURL_ETAG_SUPPORT=""
+curl_supports_etag() {
+    if [[ -z "$_CURL_ETAG_SUPPORT" ]]; then
+        if curl --help all 2>/dev/null | grep -q -- --etag-compare; then
+            _CURL_ETAG_SUPPORT="yes"
+        else
+            _CURL_ETAG_SUPPORT="no"
+        fi
+    fi
+    [[ "$_CURL_ETAG_SUPPORT" == "yes" ]]
+}
+
+# Refresh the VM list cache if still stale and emit the current payload.
+# Expects to run under the refresh lock held by fetch_vms_cached.
+# When Prism Central sends an ETag, expired refreshes revalidate with
+# If-None-Match: a 304 carries no body and the cached payload is simply
+# re-dated instead of re-transferred and re-parsed.
+_fetch_vms_refresh() {
+    local cache_file="$1"
+    local ttl="$2"
+    local etag_file="$cache_file.etag"
+
+    # Another process may have refreshed while we waited for the lock
+    if cache_is_fresh "$cache_file" "$ttl"; then
+        cat "$cache_file"
+        return 0
+    fi
+
+    # Mirrors fetch_vms, with conditional-request options added
+    local etag_args=() etag_conditional=""
+    if curl_supports_etag; then
+        etag_args+=(--etag-save "$etag_file")
+        if [[ -s "$etag_file" && -s "$cache_file" ]]; then
+            etag_args+=(--etag-compare "$etag_file")
+            etag_conditional="yes"
+        fi
+    fi
+
+    local response
+    if response=$(curl_auth -s \
+        -X POST "https://$PRISM:9440/api/nutanix/v3/vms/list" \
+        -H 'Content-Type: application/json' \
+        "${etag_args[@]+"${etag_args[@]}"}" \
+        -d '{"length":1000,"offset":0,"filter":"'"$VM_LIST_FILTER"'"}'); then
+
+        # Empty body after a conditional request means 304 Not Modified:
+        # the cached payload is still current, just refresh its TTL. Only
+        # applies when If-None-Match was actually sent - otherwise an
+        # empty response is a failure for the stale fallback below, which
+        # deliberately does not re-date the cache
+        if [[ -n "$etag_conditional" && -z "$response" && -s "$cache_file" ]]; then
+            touch "$cache_file"
+            cat "$cache_file"
+            return 0
+        fi
+
+        # Some Prism versions reject the filter expression; retry unfiltered
+        # (no conditional-request options: the saved ETag belongs to the
+        # filtered response) and let callers filter client-side. Empty
+        # responses are checked explicitly because jq 1.6's -e exits 0
+        # when given no input
+        if [[ -z "$response" ]] || ! jq -e '.entities' <<< "$response" >/dev/null 2>&1; then
+            response=$(curl_auth -s \
+                -X POST "https://$PRISM:9440/api/nutanix/v3/vms/list" \
+                -H 'Content-Type: application/json' \
+                -d '{"length":1000,"offset":0}') || response=""
+        fi
+
+        if [[ -n "$response" ]] && jq -e '.entities' <<< "$response" >/dev/null 2>&1; then
+            cache_store "$cache_file" <<< "$response"
+            printf '%s\n' "$response"
+            return 0
+        fi
+    fi
+
+    # Stale fallback: the fetch failed, serve the last good payload if any
+    if [[ -s "$cache_file" ]]; then
+        cat "$cache_file"
+        return 0
+    fi
+
+    return 1
+}
+
+# Fetch VMs with a short TTL cache and stale fallback.
+# Repeat calls within VM_LIST_CACHE_TTL seconds reuse the last payload;
+# if Prism Central is unreachable, the last good payload is served instead
+# of failing outright. Refreshes are single-flight: concurrent script
+# instances queue on a lock file, and whoever wins fetches once while the
+# rest reuse the newly cached payload.
+fetch_vms_cached() {
+    local ttl="${1:-$VM_LIST_CACHE_TTL}"
+    local target_key cache_file
+    target_key=$(cache_target_key)
+    cache_file=$(cache_file_for "vm_list.$target_key.json")
+
+    # An unusable cache directory (e.g. squatted by another user) means
+    # no caching: degrade to a plain fetch rather than trusting it
+    if ! cache_dir_ready; then
+        fetch_vms
+        return
+    fi
+
+    if cache_is_fresh "$cache_file" "$ttl"; then
+        cat "$cache_file"
+        return 0
+    fi
+
+    if command_exists flock; then
+        {
+            flock 9
+            _fetch_vms_refresh "$cache_file" "$ttl"
+        } 9> "$API_CACHE_DIR/vm_list.$target_key.lock"
+    else
+        # No flock available (e.g. macOS): fall back to unserialized refresh
+        _fetch_vms_refresh "$cache_file" "$ttl"
+    fi
 }
 
 # Fetch resources (generic)
@@ -416,7 +633,7 @@ upload_ova_chunk() {
     local offset="$4"
     local checksum="$5"
     
-    curl -s -k -u "$USER:$PASS" \
+    curl_auth -s \
         -X PUT "https://$PRISM/api/nutanix/v3/ovas/$ova_uuid/chunks" \
         -H 'Content-Type: application/octet-stream' \
         -H "X-Nutanix-Checksum-Type:SHA_1" \
@@ -634,20 +851,53 @@ handle_menu_navigation() {
 # FILE OPERATIONS
 # ============================================================================
 
+# Restore point directory names: "vm-export-" followed by timestamp-style
+# characters only. One anchored pattern replaces the scattered prefix
+# checks; slashes are excluded, so a matching name can never escape the
+# restore-points directory.
+readonly RESTORE_POINT_NAME_RE='^vm-export-[A-Za-z0-9._-]+$'
+
+# Check whether a string is a well-formed restore point name
+is_valid_restore_point_name() {
+    [[ "$1" =~ $RESTORE_POINT_NAME_RE ]]
+}
+
+# Resolve a restore point name to its directory path, or fail.
+# Validates the name and confirms the resolved path still lives inside
+# the restore-points directory (guards against symlink tricks).
+resolve_restore_point() {
+    local name="$1"
+    local base_dir="${2:-$SCRIPT_DIR/$RESTORE_POINTS_DIR}"
+
+    is_valid_restore_point_name "$name" || return 1
+
+    local path="$base_dir/$name"
+    [[ -d "$path" ]] || return 1
+
+    local real_base real_path
+    real_base=$(cd "$base_dir" 2>/dev/null && pwd -P) || return 1
+    real_path=$(cd "$path" 2>/dev/null && pwd -P) || return 1
+    [[ "$real_path" == "$real_base/"* ]] || return 1
+
+    echo "$path"
+}
+
 # Find restore points
 find_restore_points() {
     local restore_dir="${1:-$SCRIPT_DIR/$RESTORE_POINTS_DIR}"
     local restore_points=()
-    
+
     if [[ ! -d "$restore_dir" ]]; then
         return 1
     fi
-    
+
+    # Single find pass: locate the tasks CSV directly and emit its parent
+    # directory, instead of listing candidate dirs and stat()ing each one
     while IFS= read -r -d '' dir; do
-        if [[ -f "$dir/vm_export_tasks.csv" ]]; then
-            restore_points+=("$dir")
-        fi
-    done < <(find "$restore_dir" -maxdepth 1 -type d -name "vm-export-*" -print0 2>/dev/null)
+        is_valid_restore_point_name "$(basename "$dir")" || continue
+        restore_points+=("$dir")
+    done < <(find "$restore_dir" -mindepth 2 -maxdepth 2 -type f \
+        -path "*/vm-export-*/vm_export_tasks.csv" -printf '%h\0' 2>/dev/null)
     
     if [[ ${#restore_points[@]} -eq 0 ]]; then
         return 1
@@ -661,30 +911,55 @@ get_restore_point_details() {
     local restore_point="$1"
     local timestamp=$(basename "$restore_point" | sed 's/vm-export-//')
     local tasks_file="$restore_point/vm_export_tasks.csv"
+    local summary_file="$restore_point/.details_summary"
+
+    # Reuse the stored summary while nothing in the restore point has
+    # changed since it was written. -nt means strictly newer, and the
+    # rename that wrote the summary bumps the directory mtime in the same
+    # clock tick, so test "nothing is newer than the summary" rather than
+    # the summary being newer. OVAs are checked individually because one
+    # growing in place (a download still in flight) only touches its own
+    # mtime, not the directory's.
+    if [[ -s "$summary_file" ]] \
+        && ! [[ "$restore_point" -nt "$summary_file" ]] \
+        && ! [[ "$tasks_file" -nt "$summary_file" ]] \
+        && [[ -z "$(find "$restore_point" -name "*.ova" -type f -newer "$summary_file" -print -quit 2>/dev/null)" ]]; then
+        cat "$summary_file"
+        return 0
+    fi
     
-    # Count VMs
+    # Count VMs - one wc over the file, minus the header row, instead of
+    # a tail|wc pipeline
     local vm_count=0
     if [[ -f "$tasks_file" ]]; then
-        vm_count=$(tail -n +2 "$tasks_file" 2>/dev/null | wc -l)
+        vm_count=$(wc -l < "$tasks_file" 2>/dev/null || echo 0)
+        vm_count=$(( vm_count > 0 ? vm_count - 1 : 0 ))
     fi
     
-    # Calculate total size
+    # Calculate total size - find reports sizes from its own directory
+    # walk, so there is no extra stat process per OVA file
     local total_size=0
     if [[ -d "$restore_point" ]]; then
-        while IFS= read -r -d '' file; do
-            if [[ -f "$file" ]]; then
-                local file_size=$(stat -c%s "$file" 2>/dev/null || echo "0")
-                total_size=$((total_size + file_size))
-            fi
-        done < <(find "$restore_point" -name "*.ova" -print0 2>/dev/null)
+        total_size=$(find "$restore_point" -name "*.ova" -type f -printf '%s\n' 2>/dev/null | awk '{s+=$1} END {print s+0}')
     fi
     
     local readable_timestamp
     readable_timestamp=$(timestamp_to_readable "$timestamp")
-    
-    echo "$readable_timestamp|$vm_count|$total_size"
+
+    local details="$readable_timestamp|$vm_count|$total_size"
+
+    # Persist the summary atomically (tempfile + rename); read-only
+    # restore points simply skip the write
+    local tmp_file
+    if tmp_file=$(mktemp "$restore_point/.details_summary.XXXXXX" 2>/dev/null); then
+        echo "$details" > "$tmp_file"
+        mv -f "$tmp_file" "$summary_file"
+    fi
+
+    echo "$details"
 }
 
+
 # ============================================================================
 # INITIALIZATION
 # ============================================================================